@@ -1,37 +1,97 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import text # Import text
+from sqlalchemy.exc import OperationalError
 from .models import Base
 
 # Using SQLite for simplicity in this phase.
 # can be swapped for PostgreSQL in production.
 SQLALCHEMY_DATABASE_URL = "sqlite:///./questlog.db"
 
+# The default pool already reuses connections between checkouts, and the
+# WAL/busy_timeout pragmas below make those connections cheap to share.
+# (StaticPool is deliberately avoided: its single DBAPI connection would
+# put all concurrent requests in one SQLite transaction.)
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
+
+@event.listens_for(engine, "connect")
+def _tune_sqlite(dbapi_connection, connection_record):
+    """
+    Tune each raw sqlite3 connection for a web workload.
+
+    WAL lets readers proceed while a write is in flight, and
+    synchronous=NORMAL halves the fsyncs per commit (still safe in WAL).
+    The rest enlarges caches and keeps temp structures in memory.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-65536")    # 64 MB page cache
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def optimize_db():
+    """Runs PRAGMA optimize so SQLite can refresh its query planner stats."""
+    with engine.connect() as conn:
+        conn.execute(text("PRAGMA optimize"))
+
+# Bump whenever a statement is appended to _MIGRATIONS below.
+_SCHEMA_VERSION = 1
+
+# Poor man's migrations for databases created before these columns and
+# indexes existed. Gated by PRAGMA user_version so the common startup
+# path pays one pragma read instead of re-running every statement.
+_MIGRATIONS = [
+    "ALTER TABLE settings ADD COLUMN xp INTEGER DEFAULT 0",
+    "ALTER TABLE settings ADD COLUMN level INTEGER DEFAULT 1",
+    "ALTER TABLE settings ADD COLUMN daily_quote VARCHAR",
+    "ALTER TABLE settings ADD COLUMN last_quote_date DATETIME",
+    "ALTER TABLE quests ADD COLUMN image_url VARCHAR",
+    "ALTER TABLE quests ADD COLUMN position INTEGER DEFAULT 0",
+    "CREATE INDEX IF NOT EXISTS ix_quests_parent_position ON quests (parent_id, position)",
+    "CREATE INDEX IF NOT EXISTS ix_quests_parent_completed ON quests (parent_id, is_completed)",
+]
+
 def init_db():
-    """Initializes the database tables."""
+    """Initializes the database tables and applies pending migrations."""
     Base.metadata.create_all(bind=engine)
 
-    # Poor man's migration to ensure new columns exist for existing databases
-    # (Safe to run multiple times, sqlite ignores 'duplicate column' errors mostly or we catch them)
-    try:
-        with engine.connect() as conn:
-            conn.execute(text("ALTER TABLE settings ADD COLUMN xp INTEGER DEFAULT 0"))
-            conn.execute(text("ALTER TABLE settings ADD COLUMN level INTEGER DEFAULT 1"))
-            conn.execute(text("ALTER TABLE settings ADD COLUMN daily_quote VARCHAR"))
-            conn.execute(text("ALTER TABLE settings ADD COLUMN last_quote_date DATETIME"))
-            conn.execute(text("ALTER TABLE quests ADD COLUMN image_url VARCHAR"))
-            conn.execute(text("ALTER TABLE quests ADD COLUMN position INTEGER DEFAULT 0"))
-            conn.commit() # Commit explicitly for some drivers
-    except Exception:
-        pass # Columns likely exist
-
-def get_db():
-    """Dependency for FastAPI route handlers."""
+    with engine.connect() as conn:
+        if conn.execute(text("PRAGMA user_version")).scalar() >= _SCHEMA_VERSION:
+            return
+
+        for stmt in _MIGRATIONS:
+            try:
+                conn.execute(text(stmt))
+                conn.commit()
+            except OperationalError as e:
+                conn.rollback()
+                # Freshly created tables already have the column;
+                # anything else is a real failure and should surface
+                if "duplicate column name" not in str(e):
+                    raise
+        conn.execute(text(f"PRAGMA user_version = {_SCHEMA_VERSION}"))
+        conn.commit()
+
+async def get_db():
+    """
+    Dependency for FastAPI route handlers.
+
+    Async so FastAPI awaits it directly instead of dispatching to the
+    anyio threadpool (sync generator dependencies cost a context switch
+    per request). SQLite calls are fast enough to run inline.
+
+    Every request gets its own session: all async handlers run on the
+    event-loop thread, so any thread-scoped sharing would leak one
+    request's ORM state into another across await points.
+    """
     db = SessionLocal()
     try:
         yield db
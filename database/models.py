@@ -1,5 +1,6 @@
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -11,6 +12,12 @@ class Quest(Base):
     Supports a hierarchy via parent_id to allow for Main Quests and Sub-Quests.
     """
     __tablename__ = 'quests'
+    __table_args__ = (
+        # Covers the dashboard list (parent_id ordered by position) and
+        # the progress aggregation (parent_id + is_completed)
+        Index('ix_quests_parent_position', 'parent_id', 'position'),
+        Index('ix_quests_parent_completed', 'parent_id', 'is_completed'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
@@ -49,3 +56,8 @@ class Settings(Base):
     # Motivation Engine
     daily_quote = Column(String, nullable=True)
     last_quote_date = Column(DateTime, nullable=True)
+
+    @hybrid_property
+    def xp_percent(self):
+        """Progress through the current level as a percentage (500 XP per level)."""
+        return (self.xp % 500) * 0.2
@@ -1,25 +1,39 @@
 from fastapi import FastAPI, Request, Depends, Form
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from sqlalchemy import text, update, bindparam, select
 from sqlalchemy.orm import Session
 import uvicorn
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import asyncio
 import re
-from fastapi.encoders import jsonable_encoder
+import orjson
 
 # Project Imports
-from database.database import init_db, get_db
+from database.database import init_db, get_db, optimize_db, SessionLocal
 from database import models
 from services.ai import ai_service
 
+async def _periodic_optimize(interval_seconds: int = 900):
+    """Background loop running PRAGMA optimize every 15 minutes."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            optimize_db()
+        except Exception:
+            pass  # Never let maintenance kill the app
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Initialize Database on Startup
     init_db()
+    optimize_task = asyncio.create_task(_periodic_optimize())
     yield
-    # Clean up resources if needed
+    # Clean up resources
+    optimize_task.cancel()
 
 app = FastAPI(title="QuestLog", description="Gamified Goal Tracking App", lifespan=lifespan)
 
@@ -29,34 +43,77 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Set up templates
 templates = Jinja2Templates(directory="templates")
 
-# Middleware to inject theme into request state for base.html
-@app.middleware("http")
-async def add_theme_context(request: Request, call_next):
-    # This is a bit of a hack for simple SQLite access in middleware
-    # Ideally use a dependency, but middleware runs before dependencies.
-    # We'll just define a default here, and let the template render handle it mostly.
-    # Actually, Jinja2 context processors are better for this.
-    # BUT, let's just cheat and query DB within routes or attach to request.
-
-    # We will attach a default state
-    request.state.theme = "cyberpunk"
-
-    # We can try to peek at DB if needed, but creating a session here is heavy per request.
-    # Let's rely on the route handlers passing it to templates,
-    # OR simpler: Use a dependency that updates request.state
-    response = await call_next(request)
-    return response
+# Precompiled HTML fragments used by the HTMX endpoints. Fetching them
+# once at import time means responses render from Jinja bytecode (with
+# auto-escaping) instead of rebuilding f-strings per request.
+_quest_card_tpl = templates.env.get_template("_quest_card.html")
+_edit_form_tpl = templates.env.get_template("_edit_form.html")
+_progress_oob_tpl = templates.env.get_template("_progress_oob.html")
+_hero_stats_oob_tpl = templates.env.get_template("_hero_stats_oob.html")
+
+# Theme fallback as a template global: base.html reads it when no
+# settings-aware dependency has set request.state.theme, replacing the
+# middleware that ran (even for /static/*) just to assign a default.
+templates.env.globals["default_theme"] = "cyberpunk"
+
+# --- Settings cache ---
+# The Settings table holds a single row that almost every request reads
+# but only a few endpoints write. Cache a detached snapshot in memory and
+# invalidate it on write, so the common case skips a SQL round-trip.
+
+@dataclass
+class SettingsSnapshot:
+    """Plain detached copy of the Settings row, safe to use across sessions."""
+    id: int
+    hero_name: str
+    theme_name: str
+    xp: int
+    level: int
+    daily_quote: str
+    last_quote_date: datetime
+
+    @property
+    def xp_percent(self):
+        """Mirrors models.Settings.xp_percent for detached snapshots."""
+        return (self.xp % 500) * 0.2
+
+_settings_cache = {"obj": None, "version": -1}
+_settings_version = 0
+
+def invalidate_settings_cache():
+    """Call after any commit that touches the Settings row."""
+    global _settings_version
+    _settings_version += 1
 
 # Dependency to get settings and put in request state
 async def get_settings_context(request: Request, db: Session = Depends(get_db)):
-    settings = db.query(models.Settings).first()
-    if settings:
-        request.state.theme = settings.theme_name.lower()
-        request.state.hero_name = settings.hero_name
-    return settings
+    if _settings_cache["version"] != _settings_version:
+        settings = db.query(models.Settings).first()
+        _settings_cache["obj"] = SettingsSnapshot(
+            id=settings.id,
+            hero_name=settings.hero_name,
+            theme_name=settings.theme_name,
+            xp=settings.xp,
+            level=settings.level,
+            daily_quote=settings.daily_quote,
+            last_quote_date=settings.last_quote_date,
+        ) if settings else None
+        _settings_cache["version"] = _settings_version
+
+    snapshot = _settings_cache["obj"]
+    if snapshot:
+        request.state.theme = snapshot.theme_name.lower()
+        request.state.hero_name = snapshot.hero_name
+    return snapshot
+
+# --- AI result caches ---
+# Quotes are generated once per (quest, day); caching them keeps a
+# failed/slow settings write from re-triggering the Gemini round-trip.
+# (Vision URLs are memoized inside AIService.get_vision_image.)
+_quote_cache = {}  # (main quest title, date) -> quote
 
 @app.get("/", response_class=HTMLResponse)
-async def read_root(request: Request, db: Session = Depends(get_db), settings: models.Settings = Depends(get_settings_context)):
+async def read_root(request: Request, db: Session = Depends(get_db), settings: SettingsSnapshot = Depends(get_settings_context)):
     """
     First Run Experience or Dashboard.
     """
@@ -66,25 +123,56 @@ async def read_root(request: Request, db: Session = Depends(get_db), settings: m
     # Load Main Quest and Subquests
     main_quest = db.query(models.Quest).filter(models.Quest.category == "Main").first()
 
-    # Visual Vision Board: Ensure Main Quest has an image
-    if main_quest and not main_quest.image_url:
-        main_quest.image_url = ai_service.get_vision_image(main_quest.title)
-        db.commit()
-
     subquests = []
     if main_quest:
-        subquests = db.query(models.Quest).filter(models.Quest.parent_id == main_quest.id).order_by(models.Quest.position).all()
-
-        # Check Daily Quote logic
+        # Fetch only the columns the cards render: lighter rows and no
+        # ORM instance/identity-map bookkeeping per subquest
+        subquests = db.execute(
+            select(
+                models.Quest.id,
+                models.Quest.title,
+                models.Quest.category,
+                models.Quest.is_completed,
+                models.Quest.deadline,
+                models.Quest.description,
+            )
+            .where(models.Quest.parent_id == main_quest.id)
+            .order_by(models.Quest.position)
+        ).all()
+
+        # Decide what needs refreshing up front, then fire independent
+        # AI calls together so their latencies overlap instead of sum.
         today = datetime.utcnow().date()
         last_date = settings.last_quote_date.date() if settings.last_quote_date else None
 
-        if last_date != today:
-            # Generate new quote
-            new_quote = await ai_service.generate_motivation(main_quest.title)
+        need_image = not main_quest.image_url
+        need_quote = last_date != today
+        quote_key = (main_quest.title, today)
+        new_quote = _quote_cache.get(quote_key) if need_quote else None
+
+        ai_calls = []
+        if need_quote and new_quote is None:
+            ai_calls.append(ai_service.generate_motivation(main_quest.title))
+        if ai_calls:
+            results = await asyncio.gather(*ai_calls)
+            new_quote = results[0]
+            _quote_cache[quote_key] = new_quote
+
+        # Apply all pending writes in one commit (one fsync)
+        if need_image:
+            main_quest.image_url = ai_service.get_vision_image(main_quest.title)
+        if need_quote:
+            # settings is a detached snapshot: write through the live
+            # row, then patch the snapshot for this render
+            live_settings = db.query(models.Settings).first()
+            live_settings.daily_quote = new_quote
+            live_settings.last_quote_date = datetime.utcnow()
             settings.daily_quote = new_quote
-            settings.last_quote_date = datetime.utcnow()
+            settings.last_quote_date = live_settings.last_quote_date
+        if need_image or need_quote:
             db.commit()
+            if need_quote:
+                invalidate_settings_cache()
 
     return templates.TemplateResponse("dashboard.html", {
         "request": request,
@@ -94,11 +182,12 @@ async def read_root(request: Request, db: Session = Depends(get_db), settings: m
         "daily_quote": settings.daily_quote, # redundancy for template
         "level": settings.level,
         "xp": settings.xp,
-        "xp_percent": (settings.xp % 500) / 500 * 100
+        "xp_percent": settings.xp_percent,
+        "now": datetime.utcnow() # For the card overdue check
     })
 
 @app.get("/settings", response_class=HTMLResponse)
-async def settings_page(request: Request, db: Session = Depends(get_db), settings: models.Settings = Depends(get_settings_context)):
+async def settings_page(request: Request, db: Session = Depends(get_db), settings: SettingsSnapshot = Depends(get_settings_context)):
     if not settings:
         return "<p>Please finish onboarding first.</p>"
 
@@ -116,17 +205,25 @@ async def reorder_quests(item: list[str] = Form(...), db: Session = Depends(get_
     Updates the position of quests based on the list of IDs received.
     SortableJS sends 'item' as a list of strings "quest-{id}".
     """
+    # Parse all "quest-{id}" strings up front, then update every position
+    # in one executemany statement instead of a SELECT + UPDATE per quest.
+    pairs = []
     for index, item_str in enumerate(item):
         try:
-            # item_str is like "quest-5"
-            quest_id = int(item_str.split("-")[1])
-            quest = db.query(models.Quest).filter(models.Quest.id == quest_id).first()
-            if quest:
-                quest.position = index
+            pairs.append({"q_id": int(item_str.split("-")[1]), "pos": index})
         except (IndexError, ValueError):
             continue
 
-    db.commit()
+    if pairs:
+        # Core table update so SQLAlchemy runs a plain executemany
+        # instead of per-object unit-of-work tracking
+        db.execute(
+            update(models.Quest.__table__)
+            .where(models.Quest.__table__.c.id == bindparam("q_id"))
+            .values(position=bindparam("pos")),
+            pairs,
+        )
+        db.commit()
     return "" # No content needed, just 200 OK
 
 @app.post("/api/settings/update")
@@ -136,6 +233,7 @@ async def update_settings(request: Request, theme_name: str = Form(...), hero_na
         settings.theme_name = theme_name
         settings.hero_name = hero_name
         db.commit()
+        invalidate_settings_cache()
 
     # HTMX swap none means no content replacement, but we might want to show a toast?
     # For now, just a success header 204
@@ -156,6 +254,10 @@ async def ai_suggest_goal(goal: str = Form(None)):
     # Note: We must preserve the 'id' and 'name' for the form to work on subsequent submit
     return f'<input type="text" id="goal" name="goal" value="{suggestion}" required>'
 
+# Precompiled parser for AI duration strings like "2 weeks" / "1 month"
+_DUR_RE = re.compile(r'(?P<n>\d+)\s*(?P<unit>day|week|month|year)', re.I)
+_UNIT_DAYS = {"day": 1, "week": 7, "month": 30, "year": 365}
+
 @app.post("/api/ai/architect", response_class=HTMLResponse)
 async def ai_architect(db: Session = Depends(get_db)):
     """
@@ -171,48 +273,46 @@ async def ai_architect(db: Session = Depends(get_db)):
     # Save to DB
     saved_quests = []
     for task in tasks:
-        # Parse duration to date
+        # Parse duration like "2 weeks" to a date with one precompiled
+        # regex pass instead of re.search + repeated substring scans
         deadline_dt = None
-        duration_str = task['deadline'].lower()
-        days_to_add = 0
-
-        try:
-            # Simple regex parsing for "X weeks", "X months", "X days"
-            num_match = re.search(r'\d+', duration_str)
-            num = int(num_match.group()) if num_match else 1
-
-            if 'month' in duration_str:
-                days_to_add = num * 30
-            elif 'week' in duration_str:
-                days_to_add = num * 7
-            elif 'day' in duration_str:
-                days_to_add = num
-            elif 'year' in duration_str:
-                days_to_add = num * 365
-
-            if days_to_add > 0:
-                deadline_dt = datetime.now() + timedelta(days=days_to_add)
-        except Exception:
-            pass # Keep deadline as None if parsing fails
+        m = _DUR_RE.search(task['deadline'])
+        if m:
+            days_to_add = int(m['n']) * _UNIT_DAYS[m['unit'].lower()]
+            deadline_dt = datetime.now() + timedelta(days=days_to_add)
 
         q = models.Quest(
             title=task['title'],
             category=task['category'],
             parent_id=main_quest.id,
             description=f"Duration: {task['deadline']}", # Keep original text in description for reference
-            deadline=deadline_dt
+            deadline=deadline_dt,
+            # URL construction only (memoized, no API call), so populate
+            # eagerly instead of lazily detecting empty images later
+            image_url=ai_service.get_vision_image(task['title'])
         )
-        db.add(q)
         saved_quests.append(q)
 
-    db.commit()
+    # Bulk insert in one round-trip instead of unit-of-work per object.
+    # return_defaults populates the ids needed by render_quest_card.
+    if saved_quests:
+        db.bulk_save_objects(saved_quests, return_defaults=True)
+        db.commit()
 
-    # Return HTML for the cards
-    html_output = ""
-    for q in saved_quests:
-        html_output += render_quest_card(q)
+    # Return HTML for the cards (join is reliably linear, unlike +=)
+    now = datetime.utcnow()
+    return "".join(render_quest_card(q, now=now) for q in saved_quests)
 
-    return html_output
+def compute_progress(db: Session, parent_id: int) -> int:
+    """
+    Completion percent of a parent's subquests in a single aggregate
+    query (replaces the old SELECT parent + 2x COUNT round-trips).
+    """
+    total, completed = db.execute(
+        text("SELECT COUNT(*), COALESCE(SUM(is_completed), 0) FROM quests WHERE parent_id = :p"),
+        {"p": parent_id},
+    ).one()
+    return int((completed / total) * 100) if total > 0 else 0
 
 @app.post("/api/quest/{quest_id}/toggle", response_class=HTMLResponse)
 async def toggle_quest(quest_id: int, db: Session = Depends(get_db)):
@@ -237,18 +337,14 @@ async def toggle_quest(quest_id: int, db: Session = Depends(get_db)):
         settings.level = new_level
 
         db.commit()
+        invalidate_settings_cache()
 
     # Return Multiple OOB Swaps: Progress Ring AND XP Bar
 
     # 1. Recalculate progress for the main quest
     progress = 0
     if quest and quest.parent_id:
-        parent = db.query(models.Quest).filter(models.Quest.id == quest.parent_id).first()
-        total_subquests = db.query(models.Quest).filter(models.Quest.parent_id == parent.id).count()
-        completed_subquests = db.query(models.Quest).filter(models.Quest.parent_id == parent.id, models.Quest.is_completed == True).count()
-        progress = int((completed_subquests / total_subquests) * 100) if total_subquests > 0 else 0
-
-    xp_percent = (settings.xp % 500) / 500 * 100
+        progress = compute_progress(db, quest.parent_id)
 
     toast_script = ""
     if quest.is_completed and not previous_state:
@@ -257,22 +353,11 @@ async def toggle_quest(quest_id: int, db: Session = Depends(get_db)):
         # For QOL, let's just toast 'XP Gained'
         toast_script = f"<script>showToast('Gained {xp_gain} XP!');</script>"
 
-    return f"""
-    <div id="progress-ring" class="progress-ring" hx-swap-oob="true">
-        {progress}%
-    </div>
-    
-    <div id="hero-stats" class="hero-stats" hx-swap-oob="true">
-        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
-            <span style="font-weight: bold; font-size: 0.9rem;">LVL {settings.level}</span>
-            <span style="font-size: 0.8rem; color: var(--text-muted);">{settings.xp} XP</span>
-        </div>
-        <div class="xp-bar-bg">
-            <div class="xp-bar-fill" style="width: {xp_percent}%;"></div>
-        </div>
-    </div>
-    {toast_script}
-    """
+    return (
+        _progress_oob_tpl.render(progress=progress)
+        + _hero_stats_oob_tpl.render(settings=settings, xp_percent=settings.xp_percent)
+        + toast_script
+    )
 @app.delete("/api/quest/{quest_id}", response_class=HTMLResponse)
 async def delete_quest(quest_id: int, db: Session = Depends(get_db)):
     quest = db.query(models.Quest).filter(models.Quest.id == quest_id).first()
@@ -286,16 +371,9 @@ async def delete_quest(quest_id: int, db: Session = Depends(get_db)):
         # AND a side-band update for the progress ring.
 
         if parent_id:
-            parent = db.query(models.Quest).filter(models.Quest.id == parent_id).first()
-            total_subquests = db.query(models.Quest).filter(models.Quest.parent_id == parent.id).count()
-            completed_subquests = db.query(models.Quest).filter(models.Quest.parent_id == parent.id, models.Quest.is_completed == True).count()
-            progress = int((completed_subquests / total_subquests) * 100) if total_subquests > 0 else 0
-
-            return f"""
-            <div id="progress-ring" class="progress-ring" hx-swap-oob="true">
-                {progress}%
-            </div>
-            """
+            progress = compute_progress(db, parent_id)
+
+            return _progress_oob_tpl.render(progress=progress)
     return ""
 
 @app.post("/api/quest/add", response_class=HTMLResponse)
@@ -328,26 +406,7 @@ async def edit_quest_form(quest_id: int, db: Session = Depends(get_db)):
     if not quest:
         return ""
 
-    date_val = quest.deadline.strftime('%Y-%m-%d') if quest.deadline else ""
-
-    return f"""
-    <div class="card sub-quest-card" id="quest-{quest.id}" style="border-color: var(--primary-color);">
-        <form hx-put="/api/quest/{quest.id}" hx-target="#quest-{quest.id}" hx-swap="outerHTML" style="width: 100%;">
-            <div style="margin-bottom: 0.5rem;">
-                <label style="font-size: 0.7rem;">Title</label>
-                <input type="text" name="title" value="{quest.title}" required style="margin:0; padding: 0.5rem;">
-            </div>
-            <div style="margin-bottom: 0.5rem;">
-                 <label style="font-size: 0.7rem;">Deadline</label>
-                <input type="date" name="deadline" value="{date_val}" style="margin:0; padding: 0.5rem;">
-            </div>
-            <div style="display: flex; gap: 0.5rem; justify-content: flex-end;">
-                <button type="button" hx-get="/api/quest/{quest.id}/cancel" hx-target="#quest-{quest.id}" hx-swap="outerHTML" style="padding: 0.25rem 0.5rem; font-size: 0.8rem; background: transparent; border: 1px solid var(--text-muted); color: var(--text-muted);">Cancel</button>
-                <button type="submit" style="padding: 0.25rem 0.5rem; font-size: 0.8rem;">Save</button>
-            </div>
-        </form>
-    </div>
-    """
+    return _edit_form_tpl.render(quest=quest)
 
 @app.get("/api/quest/{quest_id}/cancel", response_class=HTMLResponse)
 async def cancel_edit_quest(quest_id: int, db: Session = Depends(get_db)):
@@ -361,7 +420,7 @@ async def update_quest(quest_id: int, title: str = Form(...), deadline: str = Fo
         quest.title = title
         if deadline:
             try:
-                quest.deadline = datetime.strptime(deadline, "%Y-%m-%d")
+                quest.deadline = datetime.fromisoformat(deadline)
             except ValueError:
                 pass
         else:
@@ -369,53 +428,15 @@ async def update_quest(quest_id: int, title: str = Form(...), deadline: str = Fo
         db.commit()
     return render_quest_card(quest)
 
-def render_quest_card(quest: models.Quest) -> str:
-    """Helper to render a single quest card HTML to DRY up code."""
-    date_display = quest.deadline.strftime('%b %d, %Y') if quest.deadline else (quest.description or 'No deadline')
-    checked_attr = "checked" if quest.is_completed else ""
-    completed_class = "completed" if quest.is_completed else ""
-
-    # Overdue Logic
-    is_overdue = False
-    if quest.deadline and not quest.is_completed:
-        if quest.deadline < datetime.utcnow():
-            is_overdue = True
-
-    overdue_class = "overdue" if is_overdue else ""
-    overdue_icon = "🔥 " if is_overdue else ""
-
-    return f"""
-        <div class="card sub-quest-card {completed_class} {overdue_class}" id="quest-{quest.id}">
-            <div class="quest-header">
-                <div class="quest-category">{quest.category}</div>
-                <button class="delete-btn" hx-delete="/api/quest/{quest.id}" hx-target="#quest-{quest.id}" hx-swap="outerHTML">×</button>
-            </div>
-            <div class="quest-body">
-                <input type="checkbox" class="quest-checkbox" 
-                       {checked_attr}
-                       hx-post="/api/quest/{quest.id}/toggle" 
-                       hx-target="#progress-ring" 
-                       hx-swap="outerHTML">
-                <h4 hx-get="/api/quest/{quest.id}/edit" 
-                    hx-trigger="click" 
-                    hx-target="#quest-{quest.id}" 
-                    hx-swap="outerHTML" 
-                    style="cursor: pointer;" 
-                    title="Click to edit details">{quest.title}</h4>
-            </div>
-            <!-- Client-side toggle script for immediate visual feedback on the card text -->
-            <script>
-                htmx.on("#quest-{quest.id}", "htmx:afterRequest", function(evt) {{
-                    if(evt.detail.elt.classList.contains('quest-checkbox')) {{
-                       document.getElementById("quest-{quest.id}").classList.toggle("completed");
-                    }}
-                }});
-            </script>
-            <div class="quest-meta">
-                <span style="font-size: 0.85rem; color: var(--text-muted);">{overdue_icon}📅 {date_display}</span>
-            </div>
-        </div>
+def render_quest_card(quest: models.Quest, now: datetime = None) -> str:
     """
+    Helper to render a single quest card HTML to DRY up code.
+    Callers rendering a batch should pass `now` once instead of paying
+    a datetime.utcnow() call per card.
+    """
+    if now is None:
+        now = datetime.utcnow()
+    return _quest_card_tpl.render(quest=quest, now=now)
 
 @app.post("/api/onboarding/submit", response_class=HTMLResponse)
 async def onboarding_submit(goal: str = Form(...), deadline: str = Form(None), db: Session = Depends(get_db)):
@@ -427,7 +448,7 @@ async def onboarding_submit(goal: str = Form(...), deadline: str = Form(None), d
     deadline_dt = None
     if deadline:
         try:
-            deadline_dt = datetime.strptime(deadline, "%Y-%m-%d")
+            deadline_dt = datetime.fromisoformat(deadline)
         except ValueError:
             pass # Keep as None if invalid
 
@@ -447,27 +468,48 @@ async def onboarding_submit(goal: str = Form(...), deadline: str = Form(None), d
         db.add(new_settings)
 
     db.commit()
+    invalidate_settings_cache()
+    _quote_cache.clear() # New main quest deserves a fresh quote
 
     # Using HTMX Redirect to refresh to dashboard
     response = HTMLResponse()
     response.headers["HX-Redirect"] = "/"
     return response
 
+def _export_stream():
+    """
+    Yields the backup JSON incrementally: quests are streamed in batches
+    of 500 Core rows through orjson, so peak memory stays flat no matter
+    how many quests the user has (and nothing passes through Pydantic).
+    Uses its own session because the generator runs after the request's
+    dependency scope has ended.
+    """
+    db = SessionLocal()
+    try:
+        settings = db.execute(select(models.Settings.__table__)).first()
+        yield b'{"settings":'
+        yield orjson.dumps(settings._asdict() if settings else None)
+        yield b',"quests":['
+        first = True
+        for row in db.execute(select(models.Quest.__table__).execution_options(yield_per=500)):
+            if not first:
+                yield b','
+            first = False
+            yield orjson.dumps(row._asdict())
+        yield b'],"exported_at":"' + datetime.utcnow().isoformat().encode() + b'"}'
+    finally:
+        db.close()
+
 @app.get("/api/settings/export")
-async def export_data(db: Session = Depends(get_db)):
+async def export_data():
     """
     Exports all user data (Quests + Settings) as a JSON file download.
     """
-    quests = db.query(models.Quest).all()
-    settings = db.query(models.Settings).first()
-
-    data = {
-        "settings": jsonable_encoder(settings),
-        "quests": jsonable_encoder(quests),
-        "exported_at": datetime.utcnow().isoformat()
-    }
-
-    return JSONResponse(content=data, headers={"Content-Disposition": "attachment; filename=questlog_backup.json"})
+    return StreamingResponse(
+        _export_stream(),
+        media_type="application/json",
+        headers={"Content-Disposition": "attachment; filename=questlog_backup.json"},
+    )
 
 @app.post("/api/settings/reset", response_class=HTMLResponse)
 async def reset_data(db: Session = Depends(get_db)):
@@ -479,6 +521,8 @@ async def reset_data(db: Session = Depends(get_db)):
     # Delete settings
     db.query(models.Settings).delete()
     db.commit()
+    invalidate_settings_cache()
+    _quote_cache.clear()
 
     # Redirect to home (which will show onboarding)
     response = HTMLResponse()
@@ -1,6 +1,7 @@
 import os
 import random
 import asyncio
+import functools
 import urllib.parse
 from google import genai
 from google.genai import types
@@ -155,14 +156,16 @@ class AIService:
         except Exception:
             return "The journey of a thousand miles begins with a single step."
 
+    @functools.lru_cache(maxsize=512)
     def get_vision_image(self, main_quest: str) -> str:
         """
         Returns a URL for a generated image based on the quest title.
         Uses pollinations.ai (free, no key) to generate distinct visuals.
+        Pure string construction, so results are memoized per title.
         """
         # Clean the prompt for URL
         prompt = f"cyberpunk futuristic vision board style art for goal: {main_quest}, cinematic lighting, high quality, 8k"
-        encoded_prompt = urllib.parse.quote(prompt)
+        encoded_prompt = urllib.parse.quote_plus(prompt)
         return f"https://image.pollinations.ai/prompt/{encoded_prompt}?width=1200&height=400&nologo=true"
 
 # Singleton instance
@@ -0,0 +1,13 @@
+// Shared client-side behaviour for QuestLog.
+
+// Immediate visual feedback when a quest checkbox toggles: one delegated
+// listener on the body instead of an inline <script> per card.
+document.body.addEventListener('htmx:afterRequest', function (evt) {
+    const cb = evt.detail.elt;
+    if (cb.classList && cb.classList.contains('quest-checkbox')) {
+        const card = cb.closest('.sub-quest-card');
+        if (card) {
+            card.classList.toggle('completed');
+        }
+    }
+});